@@ -1,6 +1,8 @@
 import dataclasses
+import sys
+from collections import defaultdict
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 from datetime import datetime
 
 
@@ -12,6 +14,9 @@ class AccountType(Enum):
 
 
 class BankAccount:
+    __slots__ = ("__account_number", "__account_holder", "__balance", "__account_type",
+                 "__info", "__str_prefix", "__str_suffix")
+
     def __init__(self, *, account_number: str, account_holder: str, account_type: AccountType, balance: float = 0):
         if not account_number or not account_number.strip():
             raise ValueError("Account number required")
@@ -25,6 +30,13 @@ class BankAccount:
         self.__account_holder = account_holder
         self.__balance = balance
         self.__account_type = account_type
+        self.__info = {
+            "account_number": account_number,
+            "account_holder": account_holder,
+            "account_type": account_type
+        }
+        self.__str_prefix = f"account_number: {account_number}, account_holder: {account_holder},"
+        self.__str_suffix = f" account_type: {account_type.value}"
 
     def deposit(self, amount: float):
         if amount <= 0:
@@ -38,21 +50,17 @@ class BankAccount:
             raise ValueError("Insufficient balance")
         self.__balance -= amount
 
+    def _add_to_balance(self, amount: float):
+        self.__balance += amount
+
     def get_balance(self):
         return self.__balance
 
     def get_account_info(self) -> dict[str, str]:
-        return {
-            "account_number": self.__account_number,
-            "account_holder": self.__account_holder,
-            "account_type": self.__account_type
-        }
+        return self.__info.copy()
 
     def __str__(self):
-        return (f"account_number: {self.__account_number},"
-                f" account_holder: {self.__account_holder},"
-                f" balance: {self.__balance},"
-                f" account_type: {self.__account_type.value}")
+        return f"{self.__str_prefix} balance: {self.__balance},{self.__str_suffix}"
 
     def get_account_holder(self):
         return self.__account_holder
@@ -62,12 +70,21 @@ class BankAccount:
 
 
 class SavingsAccount(BankAccount):
+    __slots__ = ("__interest_rate", "__interest_multiplier", "__min_balance", "__info", "__str_suffix")
+
     def __init__(self, account_number: str, account_holder: str,
                  balance: int = 0, interest_rate: int = 0, min_balance: int = 0):
         super().__init__(account_number=account_number, account_holder=account_holder, account_type=AccountType.SAVINGS,
                          balance=balance)
         self.__interest_rate = interest_rate
+        self.__interest_multiplier = interest_rate / 100.0
         self.__min_balance = min_balance
+        self.__info = {
+            **super().get_account_info(),
+            "interest_rate": interest_rate,
+            "min_balance": min_balance
+        }
+        self.__str_suffix = f", interest_rate: {interest_rate}%, min_balance: {min_balance}"
 
     def withdraw(self, amount: int):
         if (self.get_balance() - amount) < self.__min_balance:
@@ -78,21 +95,13 @@ class SavingsAccount(BankAccount):
         return super().withdraw(amount)
 
     def add_interest(self):
-        interest = self.get_balance() * (self.__interest_rate / 100)
-        self.deposit(interest)
+        self._add_to_balance(self.get_balance() * self.__interest_multiplier)
 
     def get_account_info(self):
-        return {
-            **super().get_account_info(),
-            "interest_rate": self.__interest_rate,
-            "min_balance": self.__min_balance
-        }
+        return self.__info.copy()
 
     def __str__(self):
-        base_info = super().__str__()
-        return (f"{base_info},"
-                f" interest_rate: {self.__interest_rate}%,"
-                f" min_balance: {self.__min_balance}")
+        return f"{super().__str__()}{self.__str_suffix}"
 
 
 class TransactionType(Enum):
@@ -100,21 +109,30 @@ class TransactionType(Enum):
     WITHDRAW = "withdraw"
     TRANSFER = "transfer"
 
-@dataclasses.dataclass(frozen = True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class Transaction:
     transaction_type: TransactionType
     account_number: str
     amount: float
     account_number_to: Optional[str] = None
-    timestamp = datetime.now()
+    timestamp: datetime = dataclasses.field(default_factory=datetime.now)
+    _timestamp_str: str = dataclasses.field(init=False, repr=False, compare=False)
+    _type_str: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "account_number", sys.intern(self.account_number))
+        if self.account_number_to is not None:
+            object.__setattr__(self, "account_number_to", sys.intern(self.account_number_to))
+        object.__setattr__(self, "_timestamp_str", self.timestamp.strftime('%Y-%m-%d %H:%M:%S'))
+        object.__setattr__(self, "_type_str", self.transaction_type.value)
 
     def __str__(self):
-        if self.transaction_type == "transfer":
-            return (f"{self.timestamp.strftime('%Y-%m-%d %H:%M:%S')} - "
-                    f"{self.transaction_type}: {self.amount} "
+        if self.transaction_type == TransactionType.TRANSFER:
+            return (f"{self._timestamp_str} - "
+                    f"{self._type_str}: {self.amount} "
                     f"from {self.account_number} to {self.account_number_to}")
-        return (f"{self.timestamp.strftime('%Y-%m-%d %H:%M:%S')} - "
-                f"{self.transaction_type}: {self.amount} "
+        return (f"{self._timestamp_str} - "
+                f"{self._type_str}: {self.amount} "
                 f"account: {self.account_number}")
 
 class Bank:
@@ -122,45 +140,85 @@ class Bank:
         self.__name = name
         self.__accounts = accounts if accounts is not None else {}
         self.__transactions: list[Transaction] = []  # История транзакций
+        self.__transactions_by_account: defaultdict[str, list[Transaction]] = defaultdict(list)
+        self.__total_balance = sum(account.get_balance() for account in self.__accounts.values())
 
     def add_account(self, account: BankAccount):
-        if account.get_account_number() in self.__accounts:
-            raise ValueError(f"Account with number:{account.get_account_number()} already exists")
-        self.__accounts[account.get_account_number()] = account
+        account_number = sys.intern(account.get_account_number())
+        if account_number in self.__accounts:
+            raise ValueError(f"Account with number:{account_number} already exists")
+        self.__accounts[account_number] = account
+        self.__total_balance += account.get_balance()
 
     def remove_account(self, account_number: str):
-        del self.__accounts[account_number]
+        account = self.__accounts.pop(account_number)
+        self.__total_balance -= account.get_balance()
 
-    def find_account(self, account_number: str):
-        if account_number not in self.__accounts:
+    def find_account(self, account_number: str) -> BankAccount:
+        account = self.__accounts.get(account_number)
+        if account is None:
             raise ValueError(f"Account with number:{account_number} does not exists")
+        return account
 
     def get_total_balance(self):
-        return sum(account.get_balance() for account in self.__accounts.values())
+        return self.__total_balance
 
     def deposit(self, account_number: str, amount: float):
-        if account_number not in self.__accounts:
-             raise ValueError(f"Account with number:{account_number} does not exists")
-        self.__accounts[account_number].deposit(amount)
-        self.__transactions.append(Transaction(TransactionType.DEPOSIT, account_number, amount))
+        account_number = sys.intern(account_number)
+        account = self.__accounts.get(account_number)
+        if account is None:
+            raise ValueError(f"Account with number:{account_number} does not exists")
+        account.deposit(amount)
+        self.__total_balance += amount
+        self.__add_transaction(Transaction(TransactionType.DEPOSIT, account_number, amount))
 
     def withdraw(self, account_number: str, amount: float):
-        if account_number not in self.__accounts:
+        account_number = sys.intern(account_number)
+        account = self.__accounts.get(account_number)
+        if account is None:
             raise ValueError(f"Account with number:{account_number} does not exists")
-        self.__accounts[account_number].withdraw(amount)
-        self.__transactions.append(Transaction(TransactionType.WITHDRAW, account_number, amount))
+        account.withdraw(amount)
+        self.__total_balance -= amount
+        self.__add_transaction(Transaction(TransactionType.WITHDRAW, account_number, amount))
+
+    def add_interest(self, account_number: str):
+        account = self.__accounts.get(account_number)
+        if not isinstance(account, SavingsAccount):
+            raise ValueError(f"Savings account with number:{account_number} does not exists")
+        balance_before = account.get_balance()
+        account.add_interest()
+        self.__total_balance += account.get_balance() - balance_before
+
+    def add_interest_to_all(self):
+        interest_total = 0
+        for account in self.__accounts.values():
+            if isinstance(account, SavingsAccount):
+                balance_before = account.get_balance()
+                account.add_interest()
+                interest_total += account.get_balance() - balance_before
+        self.__total_balance += interest_total
 
     def transfer(self, account_number_from: str, account_number_to: str, amount: float):
-        if account_number_from not in self.__accounts:
+        account_number_from = sys.intern(account_number_from)
+        account_number_to = sys.intern(account_number_to)
+        account_from = self.__accounts.get(account_number_from)
+        if account_from is None:
             raise ValueError(f"Account name:{account_number_from} does not exists")
-        if account_number_to not in self.__accounts:
+        account_to = self.__accounts.get(account_number_to)
+        if account_to is None:
             raise ValueError(f"Account name:{account_number_to} does not exists")
-        if self.__accounts[account_number_from].get_balance() - amount < 0:
+        if account_from.get_balance() - amount < 0:
             raise ValueError(f"There are not enough funds in the account")
 
-        self.__accounts[account_number_from].withdraw(amount)
-        self.__accounts[account_number_to].deposit(amount)
-        self.__transactions.append(Transaction(TransactionType.TRANSFER, account_number_from, amount, account_number_to))
+        account_from.withdraw(amount)
+        account_to.deposit(amount)
+        self.__add_transaction(Transaction(TransactionType.TRANSFER, account_number_from, amount, account_number_to))
+
+    def __add_transaction(self, transaction: Transaction):
+        self.__transactions.append(transaction)
+        self.__transactions_by_account[transaction.account_number].append(transaction)
+        if transaction.account_number_to not in (None, transaction.account_number):
+            self.__transactions_by_account[transaction.account_number_to].append(transaction)
 
     def get_accounts_by_holder(self, account_holder: str):
         return (account for account in self.__accounts.values() if account.get_account_holder() == account_holder)
@@ -168,10 +226,12 @@ class Bank:
     def get_transaction_history(self) -> list[Transaction]:
         return self.__transactions
 
-    def get_account_transactions(self, account_number: str) -> list[Transaction]:
-        return [t for t in self.__transactions 
-                if t.account_number == account_number
-                or t.account_number_to == account_number]
+    def get_account_transactions(self, account_number: str) -> Sequence[Transaction]:
+        # Returns the internal per-account list without copying; callers must not mutate it
+        return self.__transactions_by_account.get(account_number, ())
+
+    def copy_account_transactions(self, account_number: str) -> list[Transaction]:
+        return list(self.__transactions_by_account.get(account_number, ()))
 
     def __str__(self):
         if not self.__accounts: